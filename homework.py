@@ -1,7 +1,10 @@
 import os
 import time
 import logging
+import queue
+from collections import deque
 from http import HTTPStatus
+from logging.handlers import QueueHandler, QueueListener
 
 import requests
 from dotenv import load_dotenv
@@ -21,6 +24,9 @@ TOKEN_NAMES = (
 )
 
 RETRY_PERIOD = 600
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+RECENT_ERRORS_LIMIT = 10
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
@@ -29,22 +35,31 @@ HOMEWORK_VERDICTS = {
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+RESPONSE_SCHEMA = (
+    ('homeworks', list, 'списком'),
+    ('current_date', int, 'целочисленным')
+)
+_SENTINEL = object()
+STATUS_CHANGED_MESSAGE = 'Изменился статус проверки работы "{}". {}'
 
 
 def check_tokens():
     """Проверяет доступность переменных окружения."""
-    for i, token in enumerate((
-        PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID
-    )):
+    missing_tokens = []
+    for token_name, token in zip(
+        TOKEN_NAMES, (PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID)
+    ):
         if not token:
+            missing_tokens.append(token_name)
             logging.critical(
                 'Отсутствует обязательная переменная окружения: '
-                f'{TOKEN_NAMES[i]}. Программа принудительно остановлена'
+                '%s. Программа принудительно остановлена',
+                token_name
             )
         else:
-            logging.debug(f'{TOKEN_NAMES[i]} получен')
+            logging.debug('%s получен', token_name)
 
-    return all((PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID))
+    return not missing_tokens
 
 
 def send_message(bot, message):
@@ -57,19 +72,40 @@ def send_message(bot, message):
         logging.debug('Сообщение успешно отправлено в Телеграм.')
     except (apihelper.ApiException, requests.RequestException) as error:
         logging.error(
-            f'Возникла ошибка при отправке сообщения в Телеграм - {error}'
+            'Возникла ошибка при отправке сообщения в Телеграм - %s', error
         )
+        return False
 
     return True
 
 
+def parse_unauthorized_error(response_json):
+    """Извлекает описание ошибки из ответа API со статусом 401."""
+    return response_json.get('message')
+
+
+def parse_bad_request_error(response_json):
+    """Извлекает описание ошибки из ответа API со статусом 400."""
+    error = response_json.get('error') or {}
+    if not isinstance(error, dict):
+        return error
+    return error.get('error')
+
+
+ERROR_PARSERS = {
+    HTTPStatus.UNAUTHORIZED: parse_unauthorized_error,
+    HTTPStatus.BAD_REQUEST: parse_bad_request_error
+}
+
+
 def get_api_answer(timestamp):
     """Делает запрос к единственному эндпоинту API-сервиса."""
     try:
         response = requests.get(
             url=ENDPOINT,
             headers=HEADERS,
-            params={'from_date': timestamp}
+            params={'from_date': timestamp},
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
         )
     except requests.RequestException as error:
         raise ConnectionError(
@@ -81,20 +117,21 @@ def get_api_answer(timestamp):
             'Сервис недоступен. '
             f'Код статуса запроса - {response.status_code}'
         )
-        if response.status_code == HTTPStatus.UNAUTHORIZED or (
-            response.status_code == HTTPStatus.BAD_REQUEST
-        ):
-            if response.status_code == HTTPStatus.UNAUTHORIZED:
-                message_error = response.json().get('message')
-            else:
-                message_error = response.json().get('error').get('error')
-            code_error = response.json().get('code')
-            raise ConnectionError(
-                f'{msg_err}. Код ошибки сервиса: '
-                f'{code_error} - {message_error}'
-            )
-        else:
+        error_parser = ERROR_PARSERS.get(response.status_code)
+        if error_parser is None:
+            raise ConnectionError(msg_err)
+        try:
+            response_json = response.json()
+        except ValueError:
             raise ConnectionError(msg_err)
+        if not isinstance(response_json, dict):
+            raise ConnectionError(msg_err)
+        code_error = response_json.get('code')
+        message_error = error_parser(response_json)
+        raise ConnectionError(
+            f'{msg_err}. Код ошибки сервиса: '
+            f'{code_error} - {message_error}'
+        )
 
     return response.json()
 
@@ -105,43 +142,59 @@ def check_response(response):
         raise TypeError(
             'Полученные данные от сервиса должны быть словарём.'
         )
-    if 'homeworks' not in response:
-        raise KeyError(
-            'В полученном словаре нет ключа "homeworks".'
-        )
-    if not isinstance(response.get('homeworks'), list):
-        raise TypeError(
-            'Значение ключа "homeworks" должно быть списком.'
-        )
-    if 'current_date' not in response:
-        raise KeyError(
-            'В полученном словаре нет ключа "current_date".'
-        )
-    if not isinstance(response.get('current_date'), int):
-        raise TypeError(
-            'Значение ключа "current_date" должно быть целочисленным.'
-        )
+    for key, value_type, type_name in RESPONSE_SCHEMA:
+        value = response.get(key, _SENTINEL)
+        if value is _SENTINEL:
+            raise KeyError(
+                f'В полученном словаре нет ключа "{key}".'
+            )
+        if not isinstance(value, value_type):
+            raise TypeError(
+                f'Значение ключа "{key}" должно быть {type_name}.'
+            )
 
-    return response.get('homeworks')
+    return response['homeworks']
 
 
 def parse_status(homework):
     """Извлекает статус из информации о конкретной домашней работы."""
-    if 'homework_name' not in homework:
+    homework_name = homework.get('homework_name', _SENTINEL)
+    if homework_name is _SENTINEL:
         raise KeyError(
             'В списке "homeworks" нет ключа "homework_name".'
         )
-    if 'status' not in homework:
+    status = homework.get('status', _SENTINEL)
+    if status is _SENTINEL:
         raise KeyError(
             'В списке "homeworks" нет ключа "status".'
         )
-    if homework.get('status') not in HOMEWORK_VERDICTS:
+    verdict = HOMEWORK_VERDICTS.get(status)
+    if verdict is None:
         raise ValueError(
             'В списке "homeworks" неизвестный "status".'
         )
-    homework_name = homework.get('homework_name')
-    verdict = HOMEWORK_VERDICTS.get(homework.get('status'))
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return STATUS_CHANGED_MESSAGE.format(homework_name, verdict)
+
+
+def send_statuses(bot, homeworks, sent_messages):
+    """Отправляет в Telegram сообщения о статусах всех домашних работ."""
+    all_handled = True
+    for homework in reversed(homeworks):
+        try:
+            message_to_telegram = parse_status(homework)
+        except Exception as error:
+            message_to_telegram = (
+                f'Не удалось обработать домашнюю работу: {error}'
+            )
+            logging.error(message_to_telegram)
+        if message_to_telegram in sent_messages:
+            continue
+        if send_message(bot, message_to_telegram):
+            sent_messages.add(message_to_telegram)
+        else:
+            all_handled = False
+
+    return all_handled
 
 
 def main():
@@ -150,44 +203,56 @@ def main():
         exit()
 
     bot = TeleBot(token=TELEGRAM_TOKEN)
-    timestamp = int(time.time())
-    previous_message = ''
+    timestamp = time.time_ns() // 1_000_000_000
+    sent_messages = set()
+    recent_errors = deque(maxlen=RECENT_ERRORS_LIMIT)
 
     while True:
         try:
             response = get_api_answer(timestamp)
-            homework = check_response(response)
-            if homework:
-                message_to_telegram = parse_status(homework[0])
-                if message_to_telegram != previous_message:
-                    if send_message(bot, message_to_telegram):
-                        previous_message = message_to_telegram
-                        timestamp = response.get('current_date')
+            homeworks = check_response(response)
+            if homeworks:
+                if send_statuses(bot, homeworks, sent_messages):
+                    timestamp = response.get('current_date')
+                    sent_messages.clear()
             else:
                 logging.debug('Статус домашки не изменился.')
 
         except Exception as error:
             error_message = f'Сбой в работе программы: {error}'
             logging.error(error_message)
-            if error_message != previous_message:
+            if error_message not in recent_errors:
                 if send_message(bot, error_message):
-                    previous_message = error_message
+                    recent_errors.append(error_message)
+
+        else:
+            recent_errors.clear()
 
         finally:
             time.sleep(RETRY_PERIOD)
 
 
 if __name__ == '__main__':
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    log_queue = queue.Queue()
+    listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        logging.FileHandler(
+            mode='w',
+            filename='homework.log',
+            encoding='utf-8'
+        )
+    )
     logging.basicConfig(
         level=logging.DEBUG,
         format='%(asctime)s, %(levelname)s, %(message)s, %(funcName)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(
-                mode='w',
-                filename='homework.log',
-                encoding='utf-8'
-            )
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
-    main()
+    listener.start()
+    try:
+        main()
+    finally:
+        listener.stop()
@@ -0,0 +1,226 @@
+from http import HTTPStatus
+
+import pytest
+import requests
+import telebot
+
+import tests.check_utils as check_utils
+from tests.test_bot import (
+    create_mock_response_get_with_custom_status_and_data
+)
+
+CURRENT_DATE = 1000198991
+
+
+class MockHTMLResponseGET(check_utils.MockResponseGET):
+    def json(self):
+        raise ValueError('Expecting value: line 1 column 1 (char 0)')
+
+
+def mock_response_get(http_status, data=None):
+    return create_mock_response_get_with_custom_status_and_data(
+        random_timestamp=CURRENT_DATE, http_status=http_status, data=data
+    )
+
+
+def mock_html_response_get(http_status):
+    def mocked_response(*args, **kwargs):
+        return MockHTMLResponseGET(*args, http_status=http_status, **kwargs)
+
+    return mocked_response
+
+
+class TestGetApiAnswerErrors:
+
+    @pytest.mark.parametrize('error', (None, 'Wrong from_date format'))
+    def test_bad_request_with_unexpected_error_field(
+            self, monkeypatch, current_timestamp, homework_module, error
+    ):
+        monkeypatch.setattr(requests, 'get', mock_response_get(
+            HTTPStatus.BAD_REQUEST,
+            data={'code': 'UnknownError', 'error': error}
+        ))
+        with pytest.raises(ConnectionError, match='UnknownError'):
+            homework_module.get_api_answer(current_timestamp)
+
+    @pytest.mark.parametrize(
+        'http_status', (HTTPStatus.BAD_REQUEST, HTTPStatus.UNAUTHORIZED)
+    )
+    def test_error_response_with_non_json_body(
+            self, monkeypatch, current_timestamp, homework_module,
+            http_status
+    ):
+        monkeypatch.setattr(
+            requests, 'get', mock_html_response_get(http_status)
+        )
+        with pytest.raises(ConnectionError, match='Сервис недоступен'):
+            homework_module.get_api_answer(current_timestamp)
+
+
+class TestGetApiAnswerTimeout:
+
+    def test_request_uses_timeouts(
+            self, monkeypatch, current_timestamp, homework_module
+    ):
+        calls = []
+
+        def mocked_get(*args, **kwargs):
+            calls.append(kwargs)
+            return mock_response_get(HTTPStatus.OK)(*args, **kwargs)
+
+        monkeypatch.setattr(requests, 'get', mocked_get)
+        homework_module.get_api_answer(current_timestamp)
+        assert calls[0]['timeout'] == (
+            homework_module.CONNECT_TIMEOUT, homework_module.READ_TIMEOUT
+        )
+
+    def test_timeout_raises_connection_error(
+            self, monkeypatch, current_timestamp, homework_module
+    ):
+        def mocked_get(*args, **kwargs):
+            raise requests.Timeout('Read timed out.')
+
+        monkeypatch.setattr(requests, 'get', mocked_get)
+        with pytest.raises(ConnectionError, match='Read timed out'):
+            homework_module.get_api_answer(current_timestamp)
+
+
+class RecordingTelegramBot(check_utils.MockTelegramBot):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent_messages = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        super().send_message(chat_id=chat_id, text=text, **kwargs)
+        self.sent_messages.append(text)
+
+
+class FailingOnceTelegramBot(RecordingTelegramBot):
+    def __init__(self, failing_text, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failing_text = failing_text
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        if text == self.failing_text:
+            self.failing_text = None
+            raise telebot.apihelper.ApiException(
+                'Произошла ошибка при отправке сообщения в Telegram.',
+                'send_message',
+                500
+            )
+        super().send_message(chat_id=chat_id, text=text, **kwargs)
+
+
+def run_main(monkeypatch, homework_module, responses, bot=None):
+    """Run `main()` for one cycle per item of `responses`.
+
+    Return the bot and the `from_date` passed to every API request.
+    """
+    bot = bot or RecordingTelegramBot()
+    from_dates = []
+    cycles = iter(range(len(responses) - 1))
+    responses = iter(responses)
+
+    def mocked_get(*args, **kwargs):
+        from_dates.append(kwargs['params']['from_date'])
+        return next(responses)(*args, **kwargs)
+
+    def sleep_to_interrupt(secs):
+        if next(cycles, None) is None:
+            raise check_utils.BreakInfiniteLoop('break')
+
+    monkeypatch.setattr(homework_module, 'TeleBot', lambda token: bot)
+    monkeypatch.setattr(requests, 'get', mocked_get)
+    monkeypatch.setattr(homework_module.time, 'sleep', sleep_to_interrupt)
+    with pytest.raises(check_utils.BreakInfiniteLoop):
+        homework_module.main()
+    return bot, from_dates
+
+
+class TestMainErrorNotifications:
+
+    def test_error_is_reported_again_after_successful_poll(
+            self, monkeypatch, homework_module
+    ):
+        failure = mock_response_get(HTTPStatus.SERVICE_UNAVAILABLE)
+        success = mock_response_get(HTTPStatus.OK)
+        bot, _ = run_main(
+            monkeypatch, homework_module,
+            (failure, failure, success, failure)
+        )
+        assert len(bot.sent_messages) == 2
+        assert bot.sent_messages[0] == bot.sent_messages[1]
+        assert '503' in bot.sent_messages[0]
+
+
+def homeworks_response(*statuses):
+    return mock_response_get(HTTPStatus.OK, data={
+        'homeworks': [
+            {'homework_name': f'hw{i}.zip', 'status': status}
+            for i, status in enumerate(statuses)
+        ],
+        'current_date': CURRENT_DATE
+    })
+
+
+class TestMainStatusNotifications:
+
+    def test_invalid_homework_does_not_block_valid_ones(
+            self, monkeypatch, homework_module
+    ):
+        response = homeworks_response('approved', 'unknown')
+        bot, from_dates = run_main(
+            monkeypatch, homework_module,
+            (response, mock_response_get(HTTPStatus.OK))
+        )
+        assert len(bot.sent_messages) == 2
+        assert bot.sent_messages[0] == (
+            'Не удалось обработать домашнюю работу: '
+            'В списке "homeworks" неизвестный "status".'
+        )
+        assert bot.sent_messages[1] == (
+            homework_module.parse_status(
+                {'homework_name': 'hw0.zip', 'status': 'approved'}
+            )
+        )
+        assert from_dates[1] == CURRENT_DATE
+
+    def test_partial_send_failure_resends_only_failed_message(
+            self, monkeypatch, homework_module
+    ):
+        response = homeworks_response('approved', 'rejected', 'reviewing')
+        failing_text = homework_module.parse_status(
+            {'homework_name': 'hw1.zip', 'status': 'rejected'}
+        )
+        bot, from_dates = run_main(
+            monkeypatch, homework_module,
+            (response, response, mock_response_get(HTTPStatus.OK)),
+            bot=FailingOnceTelegramBot(failing_text)
+        )
+        assert len(bot.sent_messages) == 3
+        assert len(set(bot.sent_messages)) == 3
+        assert bot.sent_messages[-1] == failing_text
+        assert from_dates[1] == from_dates[0]
+        assert from_dates[2] == CURRENT_DATE
+
+
+class TestParseStatus:
+
+    def test_homework_name_present_but_none(self, homework_module):
+        result = homework_module.parse_status(
+            {'homework_name': None, 'status': 'approved'}
+        )
+        assert result.startswith('Изменился статус проверки работы "None"')
+
+    def test_status_present_but_none(self, homework_module):
+        with pytest.raises(ValueError, match='неизвестный "status"'):
+            homework_module.parse_status(
+                {'homework_name': 'hw123', 'status': None}
+            )
+
+    @pytest.mark.parametrize('missing_key', ('homework_name', 'status'))
+    def test_missing_key(self, homework_module, missing_key):
+        homework = {'homework_name': 'hw123', 'status': 'approved'}
+        del homework[missing_key]
+        with pytest.raises(KeyError, match=f'нет ключа "{missing_key}"'):
+            homework_module.parse_status(homework)